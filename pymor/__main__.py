@@ -1,3 +1,6 @@
 from . import cli
 
-cli.cmd_main.__call__()
\ No newline at end of file
+# guarded so that multiprocessing workers spawned during model
+# loading can re-import this module without re-entering the CLI
+if __name__ == "__main__":
+    cli.cmd_main.__call__()
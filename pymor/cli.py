@@ -8,7 +8,7 @@ from . import repl
 # ======
 # Initialization
 # ======
-yaml_engine = yaml.YAML()
+yaml_engine = yaml.YAML(typ = "safe", pure = False)
 yaml_engine.register_class(obj.Entry)
 yaml_engine.register_class(obj.Model)
 
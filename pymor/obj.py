@@ -1,14 +1,20 @@
 import attr
 import typing
 
+import os
+import sys
 import pathlib
+import pickle
 import importlib.util as imputil
 
 import collections
-import pygtrie
+import marisa_trie
 
 import itertools
 import functools
+import weakref
+
+import concurrent.futures
 
 import ruamel.yaml as yaml
 
@@ -16,7 +22,7 @@ import ruamel.yaml as yaml
     slots = True,
     cmp = True,
     frozen = True,
-    cache_hash = True
+    hash = False
 )
 class Entry:
     """
@@ -76,14 +82,68 @@ class Entry:
         type = str
     )
 
+    _hash = attr.ib(
+        cmp = False,
+        init = False,
+        repr = False,
+        default = None,
+        type = typing.Optional[int]
+    )
+
+    _str = attr.ib(
+        cmp = False,
+        init = False,
+        repr = False,
+        default = None,
+        type = typing.Optional[str]
+    )
+
+    def __attrs_post_init__(self) -> typing.NoReturn:
+        # precompute the hash once at construction;
+        # instances are hashed constantly while sitting in the
+        # entry sets and parse tuples, and the precomputed slot
+        # is cheaper than the branch-on-every-call
+        # that `cache_hash` would generate.
+        # `gloss` is left out: equal entries agree on it anyway
+        # (it stays part of `__eq__`), and hashing the three
+        # keying fields is enough discrimination
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((self.phon, self.feat, self.sem))
+        )
+    # === END ===
+
+    def __hash__(self) -> int:
+        return self._hash
+    # === END ===
+
+    def __reduce__(self) -> tuple:
+        # rebuild through the constructor on unpickling:
+        # string hashes are salted per interpreter,
+        # so the precomputed `_hash` slot
+        # (and the `_str` rendering that embeds it)
+        # must never survive a process boundary,
+        # which the attrs-generated slots state would let happen
+        return (
+            _unpickle_entry,
+            (self.phon, self.feat, self.sem, self.gloss)
+        )
+    # === END ===
+
     yaml_tag = "!e"
 
     def __str__(self) -> str:
-        return "{{{phon}:{sem}#({hash:X})}}".format(
-            phon = self.phon,
-            sem = self.sem,
-            hash = hash(self)
-        )
+        # instances are frozen, so the rendering is content-stable;
+        # build it on first use and keep it on a slot
+        rendered = self._str
+
+        if rendered is None:
+            rendered = f"{{{self.phon}:{self.sem}#({hash(self):X})}}"
+            object.__setattr__(self, "_str", rendered)
+        # === END IF ===
+
+        return rendered
     # === END ===
 
     @classmethod
@@ -150,19 +210,140 @@ class Entry:
         {ices:solid water}
         
         """
-        dict_actual = yaml.comments.CommentedMap()
+        # walk the mapping node's (key, value) pairs directly:
+        # the feat frozenset is built straight from the sub-nodes,
+        # without materializing an intermediate dict per entry
+        # that would be discarded right away
+        fields = {} # type: typing.Dict[str, typing.Any]
 
-        constructor.construct_mapping(node, dict_actual)
+        for key_node, value_node in node.value:
+            key = key_node.value
 
-        if "feat" in dict_actual:
-            dict_actual["feat"] = frozenset(
-                dict_actual["feat"].items()
-            )
-        # === END IF ===
-        return cls(**dict_actual)
+            if key == "feat":
+                fields[key] = frozenset(
+                    (
+                        feat_key_node.value,
+                        constructor.construct_object(
+                            feat_value_node, deep = True
+                        )
+                    )
+                    for feat_key_node, feat_value_node
+                    in value_node.value
+                )
+            else:
+                fields[key] = constructor.construct_object(
+                    value_node, deep = True
+                )
+            # === END IF ===
+        # === END FOR key_node, value_node ===
+
+        return _intern_entry(cls(**fields))
     # === END ===
 # === END CLASS ===
 
+_ENTRY_POOL = weakref.WeakValueDictionary(
+) # type: typing.MutableMapping[tuple, Entry]
+
+def _intern_entry(entry: Entry) -> Entry:
+    """
+    Give the pooled instance equal to `entry`,
+    registering `entry` itself if none is pooled yet.
+
+    Notes
+    -----
+    Rule systems and YAML loads keep constructing entries
+    that are logically identical to already registered ones;
+    interning lets all of them share one object.
+    The pool holds its values weakly,
+    so entries referenced by no model get collected as usual.
+    """
+    key = (entry.phon, entry.feat, entry.sem, entry.gloss)
+
+    pooled = _ENTRY_POOL.get(key)
+    if pooled is not None:
+        return pooled
+    # === END IF ===
+
+    _ENTRY_POOL[key] = entry
+    return entry
+# === END ===
+
+def _unpickle_entry(
+    phon: str,
+    feat: typing.FrozenSet[typing.Tuple[str, typing.Any]],
+    sem: str,
+    gloss: str
+) -> Entry:
+    """
+    Rebuild an `Entry` on unpickling.
+
+    Going through the constructor recomputes the hash
+    under the unpickling interpreter's own seed
+    and leaves the cached rendering unset;
+    the result is additionally interned into the local pool,
+    so entries arriving from sidecar caches or pool workers
+    behave exactly like locally built ones.
+    """
+    return _intern_entry(
+        Entry(phon = phon, feat = feat, sem = sem, gloss = gloss)
+    )
+# === END ===
+
+def _tokenize_kernel(
+    n: int,
+    matches: typing.List[
+        typing.List[typing.Tuple[int, typing.Tuple[int, ...]]]
+    ],
+    _range = range # bound as default: LOAD_FAST instead of LOAD_GLOBAL
+) -> typing.List[typing.List[int]]:
+    """
+    Run the segmentation DP over a precomputed match table.
+
+    Free of any reference to the model instance on purpose:
+    it takes only the flat `(end, entry IDs)` table
+    produced by `Model._all_prefix_matches`
+    and is therefore the single self-contained hot loop
+    of the tokenizer.
+
+    Everything it touches is a small int,
+    which keeps the loop allocation-light
+    and would make it directly portable
+    to a compiled kernel.
+
+    Arguments
+    ---------
+    n : int
+        The length of the request string.
+    matches : list
+        For every start position,
+        the `(end, entry IDs)` pairs matching there.
+
+    Returns
+    -------
+    ways : list of list of int
+        The analyses of the whole request,
+        as mutable lists of entry IDs.
+    """
+    # ways[i] lists the analyses of req[i:] as mutable lists;
+    # a preallocated list indexed by position spares the dict
+    # hashing of the memo-based formulation
+    ways = [None] * (n + 1) # type: typing.List[typing.List[typing.List[int]]]
+    ways[n] = [[]]
+
+    for i in _range(n - 1, -1, -1):
+        # [entry, *subsequents] hits the BUILD_LIST unpack fast path
+        # and the comprehension spares the method-call appends
+        ways[i] = [
+            [eid, *subsequents]
+            for end, entry_ids in matches[i]
+            for subsequents in ways[end]
+            for eid in entry_ids
+        ]
+    # === END FOR i ===
+
+    return ways[0]
+# === END ===
+
 @attr.s(
     slots = True,
     cmp = False,
@@ -246,18 +427,157 @@ class Model:
     _entries = attr.ib(
         repr = False,
         init = False,
-        factory = pygtrie.CharTrie,
-        type = pygtrie.CharTrie
+        factory = dict,
+        type = typing.Dict[str, typing.Tuple[Entry, ...]]
+    )
+
+    _phon_trie = attr.ib(
+        repr = False,
+        init = False,
+        default = None,
+        type = typing.Optional[marisa_trie.Trie]
+    )
+
+    _trie_dirty = attr.ib(
+        repr = False,
+        init = False,
+        default = True,
+        type = bool
+    )
+
+    _tuple_cache = attr.ib(
+        repr = False,
+        init = False,
+        factory = dict,
+        type = typing.Dict[tuple, tuple]
+    )
+
+    _first_chars = attr.ib(
+        repr = False,
+        init = False,
+        factory = set,
+        type = typing.Set[str]
+    )
+
+    _entry_by_id = attr.ib(
+        repr = False,
+        init = False,
+        factory = list,
+        type = typing.List[Entry]
+    )
+
+    _entry_ids = attr.ib(
+        repr = False,
+        init = False,
+        factory = dict,
+        type = typing.Dict[Entry, int]
+    )
+
+    _all_entries = attr.ib(
+        repr = False,
+        init = False,
+        factory = tuple,
+        type = typing.Tuple[Entry, ...]
+    )
+
+    _flat_dirty = attr.ib(
+        repr = False,
+        init = False,
+        default = True,
+        type = bool
+    )
+
+    _bucket_ids = attr.ib(
+        repr = False,
+        init = False,
+        factory = dict,
+        type = typing.Dict[str, typing.Tuple[int, ...]]
+    )
+
+    _ids_dirty = attr.ib(
+        repr = False,
+        init = False,
+        default = True,
+        type = bool
     )
 
+    _content_version = attr.ib(
+        repr = False,
+        init = False,
+        default = 0,
+        type = int
+    )
+
+    _tokenize_cache = attr.ib(
+        repr = False,
+        init = False,
+        factory = collections.OrderedDict,
+        type = typing.MutableMapping[
+            typing.Tuple[int, str],
+            typing.Tuple[typing.Tuple[Entry, ...], ...]
+        ]
+    )
+
+    def _get_trie(self) -> marisa_trie.Trie:
+        """
+        Give the marisa trie over the registered phonological forms,
+        rebuilding it beforehand if entries have been mutated.
+
+        Notes
+        -----
+        `marisa_trie.Trie` is a static structure;
+        mutations via `_add` and `delete` only mark it dirty
+        and the rebuild is deferred until the next lookup.
+
+        Being a MARISA (LOUDS succinct) trie,
+        its transition function lives in flat bit/byte arrays
+        walked in C, not in per-node Python dicts,
+        so prefix descent costs no Python-level pointer chasing.
+        """
+        if self._trie_dirty:
+            self._phon_trie = marisa_trie.Trie(
+                self._entries.keys(),
+                cache_size = marisa_trie.HUGE_CACHE,
+                order = marisa_trie.WEIGHT_ORDER,
+                weights = tuple(
+                    len(entries)
+                    for entries in self._entries.values()
+                )
+            )
+            self._trie_dirty = False
+        # === END IF ===
+
+        return self._phon_trie
+    # === END ===
+
     def __getitem__(self, key: str) -> typing.Iterator[Entry]:
-        return iter(self._entries.get(key, iter()))
+        return iter(self._entries.get(key, ()))
+    # === END ===
+
+    def _get_all_entries(self) -> typing.Tuple[Entry, ...]:
+        """
+        Give all registered entries as one flat tuple,
+        rebuilding it lazily after mutations.
+
+        Serialization and the REPL's `:model` listing
+        iterate the whole model;
+        a single contiguous tuple walks much faster
+        than hopping across the per-phon buckets.
+        """
+        if self._flat_dirty:
+            self._all_entries = tuple(
+                entry
+                for bucket in self._entries.values()
+                for entry in bucket
+            )
+            self._flat_dirty = False
+        # === END IF ===
+
+        return self._all_entries
     # === END ===
 
     def __iter__(self) -> typing.Iterator[Entry]:
-        return itertools.chain.from_iterable(
-            self._entries.values()
-        )
+        return iter(self._get_all_entries())
     # === END ===
 
     def __len__(self) -> int:
@@ -268,15 +588,25 @@ class Model:
         return self._entries.keys()
     # === END ===
 
-    def has_key(self, key: str) -> bool:
-        return self._entries.has_key(str)
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
     # === END ===
     
     def clear_caches(self) -> typing.NoReturn:
         """
-        Clear methods' LRU caches of the instance.
+        Invalidate cached tokenizations of the instance.
+
+        Notes
+        -----
+        Cached results are keyed by a content version
+        rather than discarded:
+        bumping the version makes the stale keys unreachable
+        without throwing away anything on models
+        that happen not to be re-queried,
+        and the size bound in `tokenize` reclaims the slots.
         """
-        self.tokenize.cache_clear()
+        self._content_version += 1
+        self._tuple_cache.clear()
     # === END ===
 
     @staticmethod
@@ -284,13 +614,77 @@ class Model:
         yield entry
     # ======
 
+    def _entry_id(self, entry: Entry) -> int:
+        """
+        Give the dense integer ID of `entry` within this model,
+        assigning the next one if the entry is new.
+
+        Notes
+        -----
+        IDs are append-only and never reused,
+        so `_entry_by_id` acts as a stable decode table:
+        inner computations can shuttle plain ints around
+        (cache-friendly, trivially hashable)
+        and rematerialize the entries only at the boundary.
+        """
+        eid = self._entry_ids.get(entry)
+
+        if eid is None:
+            eid = len(self._entry_by_id)
+            self._entry_ids[entry] = eid
+            self._entry_by_id.append(entry)
+        # === END IF ===
+
+        return eid
+    # === END ===
+
+    def _get_bucket_ids(
+        self
+    ) -> typing.Dict[str, typing.Tuple[int, ...]]:
+        """
+        Give the mapping from each phon
+        to the ID tuple of its entries,
+        rebuilding it lazily after mutations.
+
+        Notes
+        -----
+        The tokenize kernel runs on these plain int tuples;
+        entries are rematerialized through `_entry_by_id`
+        only at the boundary.
+        """
+        if self._ids_dirty:
+            entry_ids = self._entry_ids
+            self._bucket_ids = {
+                phon: tuple([entry_ids[entry] for entry in entries])
+                for phon, entries in self._entries.items()
+            }
+            self._ids_dirty = False
+        # === END IF ===
+
+        return self._bucket_ids
+    # === END ===
+
     def _add(self, entry: Entry) -> typing.NoReturn:
+        entry = _intern_entry(entry)
+        self._entry_id(entry)
+        self._ids_dirty = True
+        self._flat_dirty = True
         phon = entry.phon
 
-        if phon not in self._entries:
-            self._entries[phon] = set((entry, ))
-        else:
-            self._entries[phon].add(entry)
+        # buckets are tuples, not sets:
+        # they rarely hold more than a handful of homophones,
+        # and a tuple costs a fraction of a set's memory
+        # while keeping C-level membership tests
+        bucket = self._entries.get(phon)
+
+        if bucket is None:
+            self._entries[phon] = (entry, )
+            self._trie_dirty = True
+            if phon:
+                self._first_chars.add(phon[0])
+            # === END IF ===
+        elif entry not in bucket:
+            self._entries[phon] = bucket + (entry, )
         # === END IF ===
     # === END ===
 
@@ -299,14 +693,73 @@ class Model:
         self.clear_caches()
     # === END ===
 
-    def add_raw_batch(
+    def _add_batch(
         self,
         entries: typing.Iterable[Entry]
     ) -> typing.NoReturn:
+        """
+        Register many entries at once.
+
+        Notes
+        -----
+        The batch is grouped by phon first,
+        so each bucket is looked up and rebuilt exactly once
+        however many entries the batch holds for it,
+        instead of paying the dict and tuple work per entry.
+        """
+        grouped = collections.defaultdict(
+            list
+        ) # type: typing.DefaultDict[str, typing.List[Entry]]
+
         for entry in entries:
-            self._add(entry)
+            entry = _intern_entry(entry)
+            self._entry_id(entry)
+            grouped[entry.phon].append(entry)
         # === END FOR entry ===
-        
+
+        if not grouped:
+            return
+        # === END IF ===
+
+        self._ids_dirty = True
+        self._flat_dirty = True
+        entries_map = self._entries
+
+        for phon, new_entries in grouped.items():
+            bucket = entries_map.get(phon)
+
+            if bucket is None:
+                bucket = ()
+                self._trie_dirty = True
+                if phon:
+                    self._first_chars.add(phon[0])
+                # === END IF ===
+            # === END IF ===
+
+            merged = list(bucket)
+            for entry in new_entries:
+                if entry not in merged:
+                    merged.append(entry)
+                # === END IF ===
+            # === END FOR entry ===
+
+            entries_map[phon] = tuple(merged)
+        # === END FOR phon, new_entries ===
+    # === END ===
+
+    def add_raw_batch(
+        self,
+        entries: typing.Iterable[Entry]
+    ) -> typing.NoReturn:
+        """
+        Notes
+        -----
+        The whole batch costs one cache invalidation
+        and at most one deferred trie rebuild,
+        however many entries it contains;
+        prefer this over looping `add_raw` yourself.
+        """
+        self._add_batch(entries)
         self.clear_caches()
     # === END ===
 
@@ -325,16 +778,22 @@ class Model:
 
     def add_batch(self, entries: typing.Iterable[Entry]) -> typing.NoReturn:
         """
+        Notes
+        -----
+        As with `add_raw_batch`,
+        the batch is settled with a single cache invalidation
+        and a single deferred trie rebuild.
+
         Warnings
         --------
         Not supposed to be overrided.
         """
-        
-        for gen_entry in itertools.chain.from_iterable(
-            map(self.populate, entries)
-        ): 
-            self._add(gen_entry)
-        # === END FOR gen_entry ===
+
+        self._add_batch(
+            itertools.chain.from_iterable(
+                map(self.populate, entries)
+            )
+        )
 
         self.clear_caches()
     # === END ===
@@ -349,48 +808,152 @@ class Model:
         Allomorphs generated through registeration will not deleted
         along with the given entry.
 
+        The first-character fast-path set is left untouched;
+        it may thereby overshoot after deletions,
+        which only costs a missed shortcut, never a wrong result.
+
         Warnings
         --------
         Not supposed to be overrided.
         """
         
         phon = entry.phon
-        
-        if phon in self._entries:
-            self._entries[phon].discard(entry)
+        bucket = self._entries.get(phon)
+
+        if bucket is not None and entry in bucket:
+            self._entries[phon] = tuple(
+                [item for item in bucket if item != entry]
+            )
+            self._trie_dirty = True
+            self._ids_dirty = True
+            self._flat_dirty = True
             self.clear_caches()
         # === END IF ===
     # === END ===
 
-    @functools.lru_cache(maxsize = 10240)
-    def tokenize(self, req: str) -> typing.FrozenSet[typing.Tuple[Entry]]:
-        def match_single_prefix(
-            req: str,
-            matched_obj: pygtrie.Trie._Step,
-        ) -> typing.Iterable[typing.Iterator[Entry]]:
-            prefix = matched_obj.key
-            entries = matched_obj.value
-            remainder = req[len(prefix):]
-
-            if not remainder: # if you get to the end
-                return ((entry, ) for entry in entries)
-            else:
-                return (
-                    (entry, ) + subsequents
-                    for entry, subsequents
-                    in itertools.product(entries, self.tokenize(remainder)) 
-                        # RECURSION
-                )
+    def _all_prefix_matches(
+        self,
+        req: str
+    ) -> typing.List[
+        typing.List[typing.Tuple[int, typing.Tuple[int, ...]]]
+    ]:
+        """
+        Collect, for every start position in `req`,
+        the `(end, entry IDs)` pairs of the dictionary prefixes
+        matching there, in a single pass over the positions.
+
+        Notes
+        -----
+        The marisa trie exposes no incremental step API,
+        so instead of sharing descents between adjacent positions
+        the whole enumeration at each position is done
+        by one C-level `prefixes` call.
+
+        Positions are visited left to right
+        and only those reachable as the end of some earlier match
+        (position 0 to begin with) are queried at all,
+        so dead stretches of the request
+        cost nothing beyond a flag test.
+        """
+        prefixes = self._get_trie().prefixes
+        bucket_ids = self._get_bucket_ids()
+        first_chars = self._first_chars
+        _len = len
+
+        n = _len(req)
+        matches = [
+            [] for _ in range(n)
+        ] # type: typing.List[typing.List[typing.Tuple[int, typing.Tuple[int, ...]]]]
+
+        reachable = [False] * (n + 1)
+        reachable[0] = True
+
+        for i in range(n):
+            # unreachable positions and positions whose character
+            # starts no phon at all (checked against `_first_chars`)
+            # skip the trie walk setup
+            if not reachable[i] or req[i] not in first_chars:
+                continue
             # === END IF ===
-        # === END ===
 
-        return frozenset(
-            itertools.chain.from_iterable(
-                match_single_prefix(req, word_candidate)
-                for word_candidate
-                in self._entries.prefixes(req)
-            )
-        )
+            row = [
+                (i + _len(prefix), bucket_ids[prefix])
+                for prefix in prefixes(req[i:])
+            ]
+            matches[i] = row
+
+            for end, _ in row:
+                reachable[end] = True
+            # === END FOR end ===
+        # === END FOR i ===
+
+        return matches
+    # === END ===
+
+    def tokenize(
+        self,
+        req: str
+    ) -> typing.Tuple[typing.Tuple[Entry, ...], ...]:
+        """
+        Analyze `req` into the possible entry sequences.
+
+        Notes
+        -----
+        The analyses come back as a tuple of entry tuples,
+        already deduplicated;
+        callers that really want set semantics
+        can wrap the result in `frozenset` themselves,
+        sparing everyone else the per-result hashing
+        that building one here would cost.
+        """
+        if not req or req[0] not in self._first_chars:
+            # no phon can even begin here;
+            # skip the cache probe and the match table altogether
+            return ()
+        # === END IF ===
+
+        cache = self._tokenize_cache
+        cache_key = (self._content_version, req)
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            cache.move_to_end(cache_key)
+            return cached
+        # === END IF ===
+
+        n = len(req)
+        matches = self._all_prefix_matches(req)
+
+        # intern the frozen paths so that the cache entries of
+        # different requests sharing a sub-parse point at
+        # one and the same tuple
+        tuple_cache = self._tuple_cache
+
+        # the kernel computes over plain entry IDs;
+        # deduplicating on the ID tuples (hashed as small ints)
+        # is cheaper than chaining through the entry hashes,
+        # and only the survivors are decoded back to entries
+        entry_by_id = self._entry_by_id
+        seen = {
+        } # type: typing.Dict[typing.Tuple[int, ...], typing.Tuple[Entry, ...]]
+
+        for path in _tokenize_kernel(n, matches):
+            key = tuple(path)
+
+            if key not in seen:
+                frozen = tuple([entry_by_id[eid] for eid in path])
+                seen[key] = tuple_cache.setdefault(frozen, frozen)
+            # === END IF ===
+        # === END FOR path ===
+
+        result = tuple(seen.values())
+
+        cache[cache_key] = result
+        if len(cache) > 10240:
+            cache.popitem(last = False)
+        # === END IF ===
+
+        return result
     # === END ===
 
     yaml_tag = "!pymor-dict"
@@ -416,9 +979,8 @@ class Model:
         constructor: yaml.constructor.Constructor, 
         node: yaml.nodes.MappingNode
     ) -> "Model":
-        dict_actual = yaml.comments.CommentedMap()
-        constructor.construct_mapping(node, dict_actual, deep = True)
-        
+        dict_actual = constructor.construct_mapping(node, deep = True)
+
         _ = dict_actual["version"]
         res = cls()
 
@@ -429,6 +991,166 @@ class Model:
     # === END ===
 # === END CLASS ===
 
+_EXT_MODEL_CACHE = {
+} # type: typing.Dict[tuple, typing.Type["Model"]]
+
+def _import_ext_model(
+    module_name: str,
+    location: pathlib.Path
+) -> typing.Type[Model]:
+    """
+    Import the `ExtModel` class from a model's `mod.py`.
+
+    The module is registered in `sys.modules`
+    so that models pickled by reference to `ExtModel`
+    (see the sidecar cache) can be resolved back.
+
+    Imports are cached on the source mtime,
+    so repeated `:reload`s of an unchanged `mod.py`
+    skip re-executing the module
+    (and keep yielding the identical class object,
+    which in turn keeps the YAML engine cache warm).
+    """
+    try:
+        mtime = location.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    # === END TRY ===
+
+    key = (module_name, str(location), mtime)
+
+    if mtime is not None:
+        cached = _EXT_MODEL_CACHE.get(key)
+        if cached is not None:
+            return cached
+        # === END IF ===
+    # === END IF ===
+
+    module_spec = imputil.spec_from_file_location(
+        name = module_name,
+        location = location
+    )
+    module = imputil.module_from_spec(module_spec)
+    sys.modules[module_spec.name] = module
+    module_spec.loader.exec_module(module)
+
+    if mtime is not None:
+        _EXT_MODEL_CACHE[key] = module.ExtModel
+    # === END IF ===
+
+    return module.ExtModel
+# === END ===
+
+@functools.lru_cache(maxsize = 32)
+def _get_yaml_engine(cls_extdict: typing.Type[Model]) -> yaml.YAML:
+    """
+    Give a safe C-backed YAML engine
+    with `Entry` and the given model class registered,
+    one cached per class object.
+
+    Engine construction rebuilds ruamel's parser and resolver
+    tables, which is not worth repeating on every load.
+    """
+    yaml_engine = yaml.YAML(typ = "safe", pure = False)
+    yaml_engine.register_class(Entry)
+    yaml_engine.register_class(cls_extdict)
+
+    return yaml_engine
+# === END ===
+
+# bumped whenever the pickled layout of models or entries changes
+# incompatibly; sidecars carrying another stamp are re-parsed
+_SIDECAR_FORMAT = 1
+
+def _load_dict_file(
+    yaml_engine: yaml.YAML,
+    path: pathlib.Path,
+    mod_location: pathlib.Path
+) -> "Model":
+    """
+    Load one dictionary file,
+    going through a pickle sidecar cache when it is fresh.
+
+    Notes
+    -----
+    YAML parsing dominates model loading;
+    a binary sidecar (`*.cache.pkl`, written next to the source)
+    is one or two orders of magnitude faster to read back.
+    The pickled model bakes in the behavior of `ExtModel`
+    (notably the allomorphs its `populate` generated),
+    so the sidecar is trusted only when its mtime is not older
+    than those of both the YAML source and `mod.py`;
+    any failure to read or write it
+    silently falls back to the YAML path.
+    """
+    cache_path = path.with_suffix(".cache.pkl")
+
+    try:
+        source_mtime = max(
+            path.stat().st_mtime_ns,
+            mod_location.stat().st_mtime_ns
+        )
+
+        if cache_path.stat().st_mtime_ns >= source_mtime:
+            with cache_path.open("rb") as stream:
+                payload = pickle.load(stream)
+            # === END WITH stream ===
+
+            # sidecars from before the format stamp pickled the
+            # attrs slot state wholesale, entry hashes included,
+            # and must not be served; anything but the current
+            # format falls through to the YAML path and is
+            # rewritten below
+            if (
+                isinstance(payload, tuple)
+                and len(payload) == 2
+                and payload[0] == _SIDECAR_FORMAT
+            ):
+                return payload[1]
+            # === END IF ===
+        # === END IF ===
+    except (OSError, pickle.UnpicklingError, EOFError,
+            AttributeError, ImportError):
+        pass
+    # === END TRY ===
+
+    result = yaml_engine.load(path)
+
+    try:
+        with cache_path.open("wb") as stream:
+            pickle.dump(
+                (_SIDECAR_FORMAT, result),
+                stream,
+                protocol = pickle.HIGHEST_PROTOCOL
+            )
+        # === END WITH stream ===
+    except (OSError, pickle.PicklingError, TypeError):
+        pass
+    # === END TRY ===
+
+    return result
+# === END ===
+
+def _load_dict_file_mp(
+    path: pathlib.Path,
+    module_name: str,
+    mod_location: pathlib.Path
+) -> "Model":
+    """
+    Process-pool worker wrapping `_load_dict_file`.
+
+    Each worker process re-imports `ExtModel`
+    and builds its own YAML engine,
+    since neither the dynamically imported class
+    nor the engine survive pickling into a child process.
+    """
+    cls_extdict = _import_ext_model(module_name, mod_location)
+
+    return _load_dict_file(
+        _get_yaml_engine(cls_extdict), path, mod_location
+    )
+# === END ===
+
 def load_model_dir(
     model_dir: typing.Union[str, pathlib.Path],
     name: typing.Optional[str] = None
@@ -438,7 +1160,7 @@ def load_model_dir(
 
     Arguments
     ---------
-    model_dir : str or pathlib.Path
+    model_dir : str or os.PathLike
         The path to the directory.
         The directory consists of the following files:
         `mod.py`
@@ -448,42 +1170,54 @@ def load_model_dir(
         `**/*.dict.yaml` or `**/*.dict.yml`
             stores lexical entries.
     """
-    if isinstance(model_dir, pathlib.Path):
-        model_dir_path = model_dir
-    elif isinstance(model_dir, str) or isinstance(model_dir, pathlib.PurePath):
-        model_dir_path = pathlib.Path(model_dir)
-    else:
+    try:
+        model_dir_path = pathlib.Path(os.fspath(model_dir))
+    except TypeError:
         raise TypeError("""\
-The model_dir argument of the loader (given as {obj}) must be of either type str or type pathlib.Path.
+The model_dir argument of the loader (given as {obj}) must be of either type str or any os.PathLike type.
 """.format(
-            obj = repr(model_dir)
+                obj = repr(model_dir)
+            )
         )
-    )
-    # === END IF ===
+    # === END TRY ===
 
     module_name = name if name else model_dir_path.name
-    module_spec = imputil.spec_from_file_location(
-        name = "mod" + module_name,
-        location = model_dir_path / "mod.py"
-    )
-    module = imputil.module_from_spec(module_spec)
-    module_spec.loader.exec_module(module)
+    mod_location = model_dir_path / "mod.py"
 
-    cls_extdict = module.ExtModel
+    cls_extdict = _import_ext_model("mod" + module_name, mod_location)
 
-    yaml_engine = yaml.YAML()
-    yaml_engine.register_class(Entry)
-    yaml_engine.register_class(cls_extdict)
+    # one traversal of the directory tree instead of two globs
+    dict_paths = [
+        dict_path
+        for dict_path in model_dir_path.rglob("*.dict.*")
+        if dict_path.name.endswith((".dict.yaml", ".dict.yml"))
+    ]
 
-    
-    return cls_extdict.union(
-        *map(
-            yaml_engine.load,
-            itertools.chain(
-                model_dir_path.glob("**/*.dict.yaml"),
-                model_dir_path.glob("**/*.dict.yml")
+    if len(dict_paths) > 1:
+        # YAML parsing is CPU-bound and independent per file;
+        # spread it over the cores
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            models = list(
+                executor.map(
+                    _load_dict_file_mp,
+                    dict_paths,
+                    itertools.repeat("mod" + module_name),
+                    itertools.repeat(mod_location)
+                )
             )
-        ),
+        # === END WITH executor ===
+    else:
+        # spawning workers costs more than parsing a lone file
+        yaml_engine = _get_yaml_engine(cls_extdict)
+
+        models = [
+            _load_dict_file(yaml_engine, dict_path, mod_location)
+            for dict_path in dict_paths
+        ]
+    # === END IF ===
+
+    return cls_extdict.union(
+        *models,
         name = module_name,
         source_dir = model_dir_path,
         ext_src = "NotImplemented"
@@ -63,20 +63,27 @@ class State:
     # === END ===
 
     def give_info(
-        self, 
-        txt: str, 
+        self,
+        txt: str,
         kind: str = "INFO"
     ) -> typing.NoReturn:
-        self.write_formatted(
-            ("class:info", kind + ": "),
-            ("", txt),
+        # the fragment list is built inline rather than going through
+        # `write_formatted`, whose *contents splat plus list() copy
+        # would cost two extra allocations per message
+        pt.print_formatted_text(
+            pt.formatted_text.FormattedText(
+                [("class:info", kind + ": "), ("", txt)]
+            ),
+            style = self.session.style
         )
-    # === END === 
+    # === END ===
 
     def give_error(self, txt: str) -> typing.NoReturn:
-        self.write_formatted(
-            ("class:error", "ERROR: "),
-            ("", txt),
+        pt.print_formatted_text(
+            pt.formatted_text.FormattedText(
+                [("class:error", "ERROR: "), ("", txt)]
+            ),
+            style = self.session.style
         )
     # === END ===
 # === END CLASS ===
@@ -96,10 +103,15 @@ def cmd_batch_analyze(words: typing.Iterable[str], state: State):
         word_candidates = state.model.tokenize(word)
 
         if word_candidates:
-            for candidate in word_candidates:
-                pt.print_formatted_text(
+            # one joined string and a single print call per word;
+            # str(entry) is cached on the entries themselves,
+            # so repeated candidates only pay for the joins
+            pt.print_formatted_text(
+                "\n".join(
                     "-".join(map(str, candidate))
+                    for candidate in word_candidates
                 )
+            )
         else:
             state.give_info(
                 "no matches for {word}".format(
@@ -110,94 +122,129 @@ def cmd_batch_analyze(words: typing.Iterable[str], state: State):
     # === END FOR word, num ===
 # === END ===
 
-def route(
-    command_raw: str,
+def _cmd_pwd(
+    command_args: typing.List[str],
     state: State
 ) -> typing.NoReturn:
-    command_token = command_raw.split()
+    state.give_info(
+        str(pathlib.Path.cwd()),
+        kind = "Current Working Directory"
+    )
+# === END ===
 
-    if not command_token: # NO INPUT
+def _cmd_reload(
+    command_args: typing.List[str],
+    state: State
+) -> typing.NoReturn:
+    if len(command_args) != 1:
+        state.give_error(
+            "Exactly one argument is required"
+        )
         return
     # === END IF ===
 
-    command = command_token[0]
-    command_args = command_token[1:]
-    if command == ":pwd":
+    try:
+        path = pathlib.Path(command_args[0])
+
         state.give_info(
-            str(pathlib.Path.cwd()),
-            kind = "Current Working Directory"
-        )
-    elif command == ":reload":
-        if len(command_args) != 1:
-            state.give_error(
-                "Exactly one argument is required"
+            "reached the model {path}".format(
+                path = path.absolute()
             )
-            return
-        # === END IF ===
+        )
 
-        try:
-            path = pathlib.Path(command_args[0])
-            
-            state.give_info(
-                "reached the model {path}".format(
-                    path = path.absolute()
-                )
+        state.model = obj.load_model_dir(path)
+
+        state.give_info(
+            "successfully incorporated entries from {fn}".format(
+                fn = path.name
             )
+        )
+    except FileNotFoundError as not_found:
+        state.give_error("invalid file path: " + not_found.filename)
+    except Exception as e:
+        raise e
+    # === END TRY ===
+# === END ===
 
-            state.model = obj.load_model_dir(path)
+def _cmd_model(
+    command_args: typing.List[str],
+    state: State
+) -> typing.NoReturn:
+    model = state.model
 
-            state.give_info(
-                "successfully incorporated entries from {fn}".format(
-                    fn = path.name
-                )
-            )
-        except FileNotFoundError as not_found:
-            state.give_error("invalid file path: " + not_found.filename)
-        except Exception as e:
-            raise e
-        # === END TRY ===
-    elif command == ":model":
-        model = state.model
+    state.give_info(
+        model.name,
+        kind = "Model Name"
+    )
 
-        state.give_info(
-            model.name,
-            kind = "Model Name"
-        )
+    path_raw = model.source_dir
 
-        path_raw = model.source_dir
-        
-        if isinstance(path_raw, pathlib.Path):
-            path = str(path_raw.absolute())
-        else:
-            path = str(path_raw)
-        # === END IF ===
+    if isinstance(path_raw, pathlib.Path):
+        path = str(path_raw.absolute())
+    else:
+        path = str(path_raw)
+    # === END IF ===
 
-        state.give_info(
-            path,
-            kind = "Path to the Model"
-        )
+    state.give_info(
+        path,
+        kind = "Path to the Model"
+    )
 
-        state.give_info(
-            (
-                "\n" + "\n".join(map(repr, model))
-                if model._entries
-                else "empty"
-            ),
-            kind = "Dictionary"
-        )
-        # === END IF ===
-    elif command == ":model-ext-src":
-        state.give_info(
-            state.model.ext_src,
-            kind = "Source Code of the Model Extension"
-        )
-    elif command == ":match":
-        cmd_batch_analyze(command_args, state)
-    elif command in [":exit", ":quit"] :
-        raise EOFError
+    state.give_info(
+        (
+            "\n" + "\n".join(map(repr, model))
+            if model._entries
+            else "empty"
+        ),
+        kind = "Dictionary"
+    )
+# === END ===
+
+def _cmd_model_ext_src(
+    command_args: typing.List[str],
+    state: State
+) -> typing.NoReturn:
+    state.give_info(
+        state.model.ext_src,
+        kind = "Source Code of the Model Extension"
+    )
+# === END ===
+
+def _cmd_exit(
+    command_args: typing.List[str],
+    state: State
+) -> typing.NoReturn:
+    raise EOFError
+# === END ===
+
+_COMMANDS = {
+    ":pwd": _cmd_pwd,
+    ":reload": _cmd_reload,
+    ":model": _cmd_model,
+    ":model-ext-src": _cmd_model_ext_src,
+    ":match": cmd_batch_analyze,
+    ":exit": _cmd_exit,
+    ":quit": _cmd_exit,
+} # type: typing.Dict[str, typing.Callable[[typing.List[str], State], None]]
+
+def route(
+    command_raw: str,
+    state: State
+) -> typing.NoReturn:
+    command_token = command_raw.split()
+
+    if not command_token: # NO INPUT
+        return
+    # === END IF ===
+
+    command = command_token[0]
+    handler = _COMMANDS.get(command)
+
+    if handler is not None:
+        handler(command_token[1:], state)
     elif command.startswith(":"):
         state.give_error("invalid command")
-    else: 
+    else:
         cmd_batch_analyze(command_token, state)
 # === END ===
 